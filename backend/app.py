@@ -8,6 +8,7 @@ from werkzeug.utils import secure_filename
 
 from models import db, User, Candidate, Interview, InterviewQuestion, Report
 from services.interview_flow_service import InterviewFlowService
+from services.transcription_service import AudioTooLong
 
 load_dotenv()
 
@@ -26,6 +27,7 @@ UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 ALLOWED_EXTENSIONS = {'pdf', 'txt', 'docx'}
+AUDIO_READ_BYTES = 32 * 1024  # ~1s of 16 kHz 16-bit mono PCM per ASR step
 
 db.init_app(app)
 
@@ -149,15 +151,20 @@ def start_interview():
     if not candidate:
         return jsonify({'error': f'Candidate {candidate_id} not found'}), 404
 
+    mode = data.get('mode', 'text')
+    if mode not in ('text', 'voice'):
+        return jsonify({'error': 'mode must be "text" or "voice"'}), 400
+
     interview = Interview(
         candidate_id=candidate.id,
         status='active',
+        mode=mode,
         started_at=datetime.utcnow()
     )
     db.session.add(interview)
     db.session.commit()
 
-    return jsonify({'id': interview.id, 'status': 'active'}), 201
+    return jsonify({'id': interview.id, 'status': 'active', 'mode': interview.mode}), 201
 
 @app.route('/api/candidates/user/<int:user_id>', methods=['GET'])
 def get_candidate_by_user(user_id):
@@ -235,19 +242,87 @@ def submit_answer(interview_id):
     if request.method == 'OPTIONS':
         return ("", 200)
 
-    payload = request.get_json(force=True)
-    question = ...  # load question by interview_id or from payload
+    payload = request.get_json(silent=True) or {}
+    question_id = payload.get('question_id')
+    if not question_id:
+        return jsonify({'error': 'question_id is required'}), 400
+    question = InterviewQuestion.query.filter_by(id=question_id, interview_id=interview_id).first()
+    if not question:
+        return jsonify({'error': 'Question not found'}), 404
     answer_text = payload.get('answer_text', '')
-    difficulty = getattr(question, 'difficulty', None) or 'medium'
 
-    from services.interview_flow_service import InterviewFlowService
-    flow = InterviewFlowService()
+    result = flow.score_answer(question.question_text, answer_text, question.difficulty or 'medium', question.category)
+    question.response_text = answer_text
+    question.score = float(result.get('score', 0))
+    question.feedback = result.get('feedback', '')
+    db.session.commit()
+
+    return jsonify({'question_id': question.id, **result}), 200
+
+# Voice Answer: stream raw PCM audio; the request with final=true also returns the score
+@app.route('/api/interviews/<int:interview_id>/questions/<int:question_id>/audio', methods=['POST', 'OPTIONS'])
+def stream_voice_answer(interview_id, question_id):
+    if request.method == 'OPTIONS':
+        return ('', 204)
+
+    question = InterviewQuestion.query.filter_by(id=question_id, interview_id=interview_id).first()
+    if not question:
+        return jsonify({'error': 'Question not found'}), 404
+    interview = question.interview
+    if interview.mode != 'voice':
+        return jsonify({'error': 'Interview is not in voice mode'}), 400
+    accent = interview.candidate.accent_preference
+    if not flow.transcription_service.enabled(accent):
+        return jsonify({'error': 'Speech recognition backend is not configured'}), 503
+
+    try:
+        sample_rate = int(request.args.get('sample_rate', 16000))
+    except ValueError:
+        return jsonify({'error': 'sample_rate must be an integer'}), 400
+    if sample_rate <= 0:
+        return jsonify({'error': 'sample_rate must be positive'}), 400
+    if not flow.transcription_service.supports_sample_rate(sample_rate):
+        return jsonify({'error': f'Sample rate {sample_rate} Hz is not supported by the speech recognition backend'}), 400
+    final = request.args.get('final', 'true').lower() in ('1', 'true', 'yes')
+    start = request.args.get('start', 'false').lower() in ('1', 'true', 'yes')
+    session_key = f"{interview_id}:{question_id}"
+
+    if start:
+        flow.discard_voice_answer(session_key)
+    try:
+        transcript = flow.accept_audio(session_key, b"", sample_rate, accent)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if transcript is None:
+        return jsonify({'error': 'Speech recognition backend is unavailable'}), 503
+
+    try:
+        # Feed the body to the recognizer as it arrives instead of buffering the whole upload
+        while True:
+            chunk = request.stream.read(AUDIO_READ_BYTES)
+            if not chunk:
+                break
+            transcript = flow.accept_audio(session_key, chunk, sample_rate, accent)
+
+        if not final:
+            return jsonify({'question_id': question.id, 'partial_transcript': transcript or "", 'final': False}), 200
+
+        result = flow.finish_voice_answer(session_key, question.question_text, question.difficulty or 'medium', question.category)
+    except AudioTooLong as e:
+        flow.discard_voice_answer(session_key)
+        return jsonify({'error': f'Audio too long: {e}'}), 413
+    except Exception as e:
+        # Drop the half-received answer so a retry starts clean
+        flow.discard_voice_answer(session_key)
+        print(f"[stream_voice_answer] Failed to process audio for {session_key}: {e}")
+        return jsonify({'error': 'Failed to process audio'}), 500
+
+    question.response_text = result['transcript']
+    question.score = float(result.get('score', 0))
+    question.feedback = result.get('feedback', '')
+    db.session.commit()
 
-    # Debug:
-    import inspect
-    print("[submit_answer] InterviewFlowService source ok?", hasattr(flow, "score_answer"))
-    result = flow.score_answer(question.question_text, answer_text, difficulty)
-    return jsonify(result)
+    return jsonify({'question_id': question.id, 'final': True, **result}), 200
 
 # Complete Interview + Generate Report
 @app.route('/api/interviews/<int:interview_id>/complete', methods=['POST'])
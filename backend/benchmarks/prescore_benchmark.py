@@ -0,0 +1,100 @@
+# benchmarks/prescore_benchmark.py
+"""
+Measures how many answers per second AnswerPreScorer handles, one at a time
+(as score_answer calls it) and in batches, and how many answers skip the LLM.
+
+Usage (from backend/):  python benchmarks/prescore_benchmark.py [num_answers]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.answer_prescorer import AnswerPreScorer
+from services.question_bank import QUESTION_TEMPLATES, bank_skills, category_for_skill
+
+# Should be scored locally
+TRIVIAL_ANSWERS = [
+    "",
+    "yes",
+    "I am not sure",
+]
+
+# Real on-topic answers; any of these skipping the LLM is a false skip
+GOOD_ANSWERS = [
+    "I built a data pipeline in Python with pandas that cut report generation from hours to minutes. "
+    "I owned the design, wrote the tests and deployed it on AWS behind a REST API.",
+    "Our team disagreed on the release plan. I set up a meeting with my manager, we listed the risks "
+    "and agreed to ship in two phases; the result was an on-time release and fewer incidents.",
+    "At my last job I worked on a payments app; I wrote most of the backend and cut latency by half.",
+    "I led the migration of our billing system to microservices, splitting the monolith one bounded "
+    "context at a time and keeping both paths running until the numbers matched.",
+    "A junior engineer kept getting stuck on code reviews, so we paired twice a week for a month; "
+    "by the end she was reviewing other people's changes on her own.",
+]
+
+
+def _questions():
+    return [(tmpl.format(skill=skill), category_for_skill(skill)) for skill in bank_skills() for tmpl in QUESTION_TEMPLATES]
+
+
+def main(num_answers=20000):
+    random.seed(0)
+    pairs = _questions()
+    bank = [q for q, _ in pairs]
+
+    questions, categories, answers, kinds = [], [], [], []
+    for _ in range(num_answers):
+        question, category = random.choice(pairs)
+        kind = random.choice(['trivial', 'echo', 'good', 'good'])
+        if kind == 'trivial':
+            answer = random.choice(TRIVIAL_ANSWERS)
+        elif kind == 'echo':
+            answer = question
+        else:
+            answer = random.choice(GOOD_ANSWERS)
+        questions.append(question)
+        categories.append(category)
+        answers.append(answer)
+        kinds.append(kind)
+
+    start = time.perf_counter()
+    scorer = AnswerPreScorer(bank)
+    print(f"fit on {len(bank)} bank questions: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    single = min(num_answers, 2000)
+    start = time.perf_counter()
+    for q, a, c in zip(questions[:single], answers[:single], categories[:single]):
+        scorer.prescore(q, a, c)
+    elapsed = time.perf_counter() - start
+    print(f"single: {single / elapsed:,.0f} answers/s ({single} answers)")
+
+    for batch_size in (64, 512):
+        start = time.perf_counter()
+        results = []
+        for i in range(0, num_answers, batch_size):
+            results.extend(scorer.prescore_batch(questions[i:i + batch_size], answers[i:i + batch_size],
+                                                 categories[i:i + batch_size]))
+        elapsed = time.perf_counter() - start
+        print(f"batch {batch_size}: {num_answers / elapsed:,.0f} answers/s ({num_answers} answers)")
+
+    trivial = [r for r, k in zip(results, kinds) if k != 'good']
+    good = [r for r, k in zip(results, kinds) if k == 'good']
+    true_skips = sum(1 for r in trivial if r["result"])
+    false_skips = sum(1 for r in good if r["result"])
+    print(f"trivial answers scored locally: {true_skips}/{len(trivial)}")
+    print(f"good answers scored locally (false skips): {false_skips}/{len(good)}")
+
+    # Every good answer against every bank question must reach the LLM
+    for question, category in pairs:
+        for answer in GOOD_ANSWERS:
+            pre = scorer.prescore(question, answer, category)
+            if pre["result"]:
+                print(f"FALSE SKIP: {question!r} <- {answer[:40]!r}: {pre['result']['feedback']}")
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
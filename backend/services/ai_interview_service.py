@@ -77,15 +77,20 @@ class AIInterviewService:
             print(f"[OpenAI] generate_questions failed: {e}")
         return []
 
-    def score_answer(self, question_text, candidate_answer, difficulty='medium'):
+    def score_answer(self, question_text, candidate_answer, difficulty='medium', hints=None):
         if not self.enabled():
             return {}
+        signals = f"""
+        Automatic pre-checks (hints only, not a score):
+        {hints}
+        """ if hints else ""
         prompt = f"""
         Evaluate the candidate's answer.
 
         Question: {question_text}
         Difficulty: {difficulty}
         Candidate's Answer: {candidate_answer}
+        {signals}
 
         Return ONLY JSON:
         {{
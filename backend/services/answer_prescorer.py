@@ -0,0 +1,146 @@
+# services/answer_prescorer.py
+import math
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from services.question_bank import SKILL_KEYWORDS, build_question_bank
+
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+STOPWORDS = frozenset("""
+a an and are as at be but by can did do does for from had has have how i if in into is it its me my
+of on or our so that the their them then there this to us was we were what when where which who why
+will with you your
+""".split())
+
+# Words a relevant answer to each question category tends to contain
+CATEGORY_KEYWORDS = {
+    'technical': ['design', 'implement', 'code', 'data', 'system', 'api', 'database', 'performance',
+                  'test', 'deploy', 'debug', 'architecture', 'scale', 'build', 'service', 'query'],
+    'behavioral': ['team', 'situation', 'task', 'action', 'result', 'learn', 'challenge', 'feedback',
+                   'communicate', 'colleague', 'manager', 'conflict', 'help', 'outcome', 'mentor'],
+    'domain': ['business', 'customer', 'requirement', 'process', 'industry', 'user', 'product'],
+}
+
+
+def _normalize(token):
+    # Crude plural folding so "tests"/"test" and "queries"/"query" match
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [_normalize(t) for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class AnswerPreScorer:
+    """
+    Cheap local checks run before the LLM. Only trivial answers (empty, a few words,
+    restating the question) get a score here; everything else gets a feature dict
+    that is passed along to the LLM prompt, including a possible off-topic flag.
+    Text is compared with TF-IDF vectors fitted on the question bank.
+    """
+    MIN_WORDS = 5
+    ECHO_SIMILARITY = 0.8       # answer is mostly the question repeated
+    OFF_TOPIC_SIMILARITY = 0.05
+
+    def __init__(self, question_bank: Optional[List[str]] = None):
+        docs = [tokenize(q) for q in (question_bank or build_question_bank())]
+        self.vocab = {}
+        for tokens in docs:
+            for t in tokens:
+                self.vocab.setdefault(t, len(self.vocab))
+        df = np.zeros(len(self.vocab), dtype=np.float32)
+        for tokens in docs:
+            df[[self.vocab[t] for t in set(tokens)]] += 1
+        # Smoothed IDF as in scikit-learn; unseen terms get the maximum weight
+        self.idf = np.log((1 + len(docs)) / (1 + df)) + 1
+        self.unseen_idf = math.log(1 + len(docs)) + 1
+        self.bank_matrix = self._tfidf(docs)
+        self.skills = {_normalize(s) for s in SKILL_KEYWORDS}
+
+    def _tfidf(self, token_lists: List[List[str]]) -> np.ndarray:
+        """L2-normalised TF-IDF rows. Terms outside the bank vocabulary get extra columns after it."""
+        index = dict(self.vocab)
+        rows, cols = [], []
+        for row, tokens in enumerate(token_lists):
+            for t in tokens:
+                rows.append(row)
+                cols.append(index.setdefault(t, len(index)))
+        counts = np.zeros((len(token_lists), len(index)), dtype=np.float32)
+        np.add.at(counts, (rows, cols), 1)
+        idf = np.concatenate([self.idf, np.full(len(index) - len(self.vocab), self.unseen_idf, dtype=np.float32)])
+        weights = counts * idf
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return weights / norms
+
+    def _category_terms(self, category):
+        return {_normalize(k) for k in CATEGORY_KEYWORDS.get((category or '').lower(), [])}
+
+    def prescore(self, question_text: str, answer_text: str, category: str = None) -> Dict:
+        return self.prescore_batch([question_text], [answer_text], [category])[0]
+
+    def prescore_batch(self, questions: List[str], answers: List[str], categories: List[str] = None) -> List[Dict]:
+        """
+        Returns one {"features": {...}, "result": {...} or None} per answer.
+        "result" is set when the answer was scored locally and the LLM can be skipped.
+        """
+        categories = categories or [None] * len(questions)
+        q_tokens = [tokenize(q) for q in questions]
+        a_tokens = [tokenize(a) for a in answers]
+
+        # Questions and answers share one matrix so out-of-bank terms line up
+        matrix = self._tfidf(q_tokens + a_tokens)
+        q_vecs, a_vecs = matrix[:len(questions)], matrix[len(questions):]
+        question_sim = np.einsum('ij,ij->i', q_vecs, a_vecs)
+        bank_sim = (a_vecs[:, :len(self.vocab)] @ self.bank_matrix.T).max(axis=1) if len(self.bank_matrix) else np.zeros(len(answers))
+
+        out = []
+        for i, answer in enumerate(answers):
+            answer_set = set(a_tokens[i])
+            skills = {t for t in q_tokens[i] if t in self.skills}
+            matched_skills = sorted(skills & answer_set)
+            # Category terms are a loose vocabulary, so report a count rather than a fraction of the list
+            matched_terms = sorted(self._category_terms(categories[i]) & answer_set)
+            features = {
+                "word_count": len((answer or "").split()),
+                "skill_overlap": round(len(matched_skills) / len(skills), 3) if skills else None,
+                "matched_skills": matched_skills,
+                "category_terms_matched": len(matched_terms),
+                "matched_category_terms": matched_terms,
+                "question_similarity": round(float(question_sim[i]), 3),
+                "bank_similarity": round(float(bank_sim[i]), 3),
+            }
+            # Too weak to score on (answers rarely reuse the question's words), so only a hint for the LLM
+            features["possibly_off_topic"] = (not matched_skills and not matched_terms
+                                              and features["question_similarity"] < self.OFF_TOPIC_SIMILARITY
+                                              and features["bank_similarity"] < self.OFF_TOPIC_SIMILARITY)
+            out.append({"features": features, "result": self._decide(features)})
+        return out
+
+    def _decide(self, f):
+        if f["word_count"] == 0:
+            return self._result(0.0, "No answer was given.", "Answer the question, even briefly, to get credit.")
+        if f["word_count"] < self.MIN_WORDS:
+            return self._result(10.0, "The answer is too short to evaluate.",
+                                "Explain your reasoning and give a concrete example.")
+        if f["question_similarity"] >= self.ECHO_SIMILARITY:
+            return self._result(15.0, "The answer mostly repeats the question.",
+                                "Answer in your own words with specifics from your experience.")
+        return None
+
+    @staticmethod
+    def _result(score, feedback, improvement):
+        return {
+            "score": score,
+            "feedback": feedback,
+            "strengths": [],
+            "areas_for_improvement": [improvement],
+            "prescored": True
+        }
+
@@ -2,12 +2,17 @@
 from typing import List, Dict
 
 from services.ai_interview_service import AIInterviewService
+from services.answer_prescorer import AnswerPreScorer
+from services.question_bank import DEFAULT_SKILLS, QUESTION_TEMPLATES, category_for_skill
 from services.resume_service import ResumeService
+from services.transcription_service import TranscriptionService
 
 class InterviewFlowService:
     def __init__(self):
         self.resume_service = ResumeService()
         self.ai_service = AIInterviewService()
+        self.transcription_service = TranscriptionService()
+        self.prescorer = AnswerPreScorer()
 
     def extract_resume_text(self, filepath, ext):
         text = self.resume_service.extract_text_from_file(filepath, ext)
@@ -26,22 +31,65 @@ class InterviewFlowService:
         info = self.resume_service.parse_resume_info(resume_text)
         parsed_skills = info.get('skills', [])
         # If we didn’t parse any skills, broaden defaults but vary templates
-        skills = parsed_skills or ['SQL', 'Python', 'Problem-solving', 'Teamwork', 'Communication', 'AWS', 'Docker']
-        templates = [
-            "Describe a project where you used {skill}. What was your role and impact?",
-            "Tell me about a challenge involving {skill} and how you resolved it.",
-            "How do you approach design decisions when working with {skill}?",
-            "What common pitfalls have you seen with {skill}, and how do you avoid them?",
-            "Share a time you mentored someone on {skill}. What was the outcome?"
-        ]
+        skills = parsed_skills or DEFAULT_SKILLS
         questions = []
         for i in range(num_questions):
             skill = skills[i % len(skills)]
-            tmpl = templates[i % len(templates)]
+            tmpl = QUESTION_TEMPLATES[i % len(QUESTION_TEMPLATES)]
             questions.append({
                 "question_text": tmpl.format(skill=skill),
-                "category": "technical" if skill.lower() not in ["teamwork", "communication", "problem-solving"] else "behavioral",
+                "category": category_for_skill(skill),
                 "difficulty": difficulty,
                 "time_limit_seconds": 180
             })
-        return questions
\ No newline at end of file
+        return questions
+
+    def score_answer(self, question_text: str, answer_text: str, difficulty: str = 'medium', category: str = None) -> Dict:
+        # Trivial answers are scored locally; the rest carry the local features into the LLM prompt
+        pre = self.prescorer.prescore(question_text, answer_text, category)
+        if pre["result"]:
+            return pre["result"]
+
+        if self.ai_service.enabled():
+            hints = self._format_prescore_hints(pre["features"])
+            result = self.ai_service.score_answer(question_text, answer_text, difficulty, hints)
+            if result:
+                return result
+
+        # Fallback: neutral score so the interview can continue without the LLM
+        return {
+            "score": 70.0,
+            "feedback": "Answer recorded. Detailed AI feedback is unavailable right now.",
+            "strengths": [],
+            "areas_for_improvement": []
+        }
+
+    @staticmethod
+    def _format_prescore_hints(features: Dict) -> str:
+        skill_overlap = features.get("skill_overlap")
+        lines = [
+            f"- Word count: {features.get('word_count', 0)}",
+            f"- Skills named in the question that the answer mentions: "
+            f"{'n/a' if skill_overlap is None else skill_overlap}"
+            f" ({', '.join(features.get('matched_skills') or []) or 'none'})",
+            f"- Typical category terms used: {features.get('category_terms_matched', 0)}"
+            f" ({', '.join(features.get('matched_category_terms') or []) or 'none'})",
+            f"- TF-IDF similarity to the question: {features.get('question_similarity', 0)}",
+            f"- Highest TF-IDF similarity to the question bank: {features.get('bank_similarity', 0)}",
+        ]
+        if features.get("possibly_off_topic"):
+            lines.append("- Shares no vocabulary with the question; check whether it is off-topic")
+        return "\n        ".join(lines)
+
+    def accept_audio(self, session_key: str, chunk: bytes, sample_rate: int = 16000, accent: str = None):
+        return self.transcription_service.accept(session_key, chunk, sample_rate, accent)
+
+    def discard_voice_answer(self, session_key: str):
+        self.transcription_service.discard(session_key)
+
+    def finish_voice_answer(self, session_key: str, question_text: str, difficulty: str = 'medium', category: str = None) -> Dict:
+        # Score in the same call that closes the utterance, so the client gets feedback with its last chunk
+        transcript = self.transcription_service.finish(session_key) or ""
+        result = self.score_answer(question_text, transcript, difficulty, category)
+        result["transcript"] = transcript
+        return result
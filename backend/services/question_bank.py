@@ -0,0 +1,36 @@
+# services/question_bank.py
+from typing import List
+
+# Skills recognised in resumes and questions
+SKILL_KEYWORDS = [
+    'python', 'java', 'react', 'sql', 'javascript', 'aws', 'docker', 'kubernetes',
+    'django', 'spring', 'node', 'typescript', 'azure', 'gcp', 'terraform', 'git',
+    'rest', 'graphql', 'flask', 'pandas', 'spark', 'hadoop'
+]
+
+# Used when no skills could be parsed from the resume
+DEFAULT_SKILLS = ['SQL', 'Python', 'Problem-solving', 'Teamwork', 'Communication', 'AWS', 'Docker']
+BEHAVIORAL_SKILLS = ['teamwork', 'communication', 'problem-solving']
+
+QUESTION_TEMPLATES = [
+    "Describe a project where you used {skill}. What was your role and impact?",
+    "Tell me about a challenge involving {skill} and how you resolved it.",
+    "How do you approach design decisions when working with {skill}?",
+    "What common pitfalls have you seen with {skill}, and how do you avoid them?",
+    "Share a time you mentored someone on {skill}. What was the outcome?"
+]
+
+
+def category_for_skill(skill: str) -> str:
+    return "behavioral" if skill.lower() in BEHAVIORAL_SKILLS else "technical"
+
+
+def bank_skills() -> List[str]:
+    seen = {s.lower() for s in DEFAULT_SKILLS}
+    return DEFAULT_SKILLS + [s.capitalize() for s in SKILL_KEYWORDS if s not in seen]
+
+
+def build_question_bank(skills: List[str] = None) -> List[str]:
+    """Every template filled with every skill; the reference corpus for local answer checks."""
+    skills = skills or bank_skills()
+    return [tmpl.format(skill=skill) for skill in skills for tmpl in QUESTION_TEMPLATES]
@@ -6,6 +6,8 @@ from typing import List
 from pdfminer.high_level import extract_text as pdf_extract_text
 from docx import Document  # correct docx parser
 
+from services.question_bank import SKILL_KEYWORDS
+
 class ResumeService:
     @staticmethod
     def extract_text_from_file(file_path, ext):
@@ -50,12 +52,6 @@ class ResumeService:
             'education': []
         }
         text = (resume_text or "").lower()
-        # Expand skill map a bit and avoid substring collisions by basic word boundaries where possible
-        skill_map = [
-            'python', 'java', 'react', 'sql', 'javascript', 'aws', 'docker', 'kubernetes',
-            'django', 'spring', 'node', 'typescript', 'azure', 'gcp', 'terraform', 'git',
-            'rest', 'graphql', 'flask', 'pandas', 'spark', 'hadoop'
-        ]
-        info['skills'] = [s.capitalize() for s in skill_map if s in text]
+        info['skills'] = [s.capitalize() for s in SKILL_KEYWORDS if s in text]
         # You can further enhance: regex for years of experience, roles by titles, education by degrees.
         return info
\ No newline at end of file
@@ -0,0 +1,280 @@
+# services/transcription_service.py
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+# Candidate.accent_preference -> language tag used to pick an ASR model
+ACCENT_LANGUAGES = {
+    'us': 'en-us',
+    'uk': 'en-gb',
+    'indian': 'en-in',
+}
+
+
+class AudioTooLong(Exception):
+    """Raised when a buffered answer exceeds the backend's audio limit."""
+
+
+class TranscriptionStream(ABC):
+    """
+    One utterance being transcribed. Audio is raw 16-bit little-endian mono PCM,
+    and every chunk holds whole samples (TranscriptionService buffers odd bytes).
+    accept() returns the best transcript so far; finish() returns the final text.
+    """
+    @abstractmethod
+    def accept(self, chunk: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def finish(self) -> str:
+        pass
+
+
+class TranscriptionBackend:
+    name = 'none'
+
+    def enabled(self, language: Optional[str] = None):
+        return False
+
+    def supports_sample_rate(self, sample_rate: int) -> bool:
+        return sample_rate > 0
+
+    def create_stream(self, sample_rate: int, language: str) -> Optional[TranscriptionStream]:
+        return None
+
+
+class _VoskStream(TranscriptionStream):
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+        self.segments = []
+
+    def _text(self, partial=""):
+        return " ".join([s for s in self.segments + [partial] if s]).strip()
+
+    def accept(self, chunk):
+        # AcceptWaveform returns True when Vosk detects the end of a segment (silence)
+        if self.recognizer.AcceptWaveform(chunk):
+            self.segments.append(json.loads(self.recognizer.Result()).get('text', ''))
+            return self._text()
+        return self._text(json.loads(self.recognizer.PartialResult()).get('partial', ''))
+
+    def finish(self):
+        self.segments.append(json.loads(self.recognizer.FinalResult()).get('text', ''))
+        return self._text()
+
+
+class VoskBackend(TranscriptionBackend):
+    """
+    Offline streaming ASR via Vosk. Decodes audio as it arrives, so finish() only
+    has to flush the last segment.
+    VOSK_MODEL_PATH points to a model directory; VOSK_MODEL_PATH_EN_GB etc. override it per accent.
+    """
+    name = 'vosk'
+
+    def __init__(self):
+        self._models = {}
+        self._failed_paths = set()
+        self._lock = threading.Lock()
+        try:
+            import vosk
+            vosk.SetLogLevel(-1)
+            self._vosk = vosk
+        except ImportError:
+            print("[TranscriptionService] vosk is not installed; voice answers cannot be transcribed.")
+            self._vosk = None
+
+    def enabled(self, language=None):
+        """With a language, whether that accent has a usable model; otherwise whether any accent does."""
+        if self._vosk is None:
+            return False
+        languages = [language] if language else ACCENT_LANGUAGES.values()
+        return any(self._model_path(lang) and self._model_path(lang) not in self._failed_paths for lang in languages)
+
+    def _model_path(self, language):
+        key = "VOSK_MODEL_PATH_" + language.upper().replace('-', '_')
+        return os.getenv(key) or os.getenv("VOSK_MODEL_PATH")
+
+    def _model(self, language):
+        path = self._model_path(language)
+        model = self._models.get(path)
+        if model is None:
+            # Loading a model takes seconds; do it outside the lock so loaded models stay usable,
+            # then share one instance per path across streams
+            model = self._vosk.Model(path)
+            with self._lock:
+                model = self._models.setdefault(path, model)
+        return model
+
+    def create_stream(self, sample_rate, language):
+        if not self.enabled(language):
+            return None
+        path = self._model_path(language)
+        try:
+            return _VoskStream(self._vosk.KaldiRecognizer(self._model(language), sample_rate))
+        except Exception as e:
+            # Most likely a bad model directory; stop advertising it so callers get a 503
+            print(f"[TranscriptionService] Failed to load Vosk model {path}: {e}")
+            self._failed_paths.add(path)
+            return None
+
+
+class _BufferedStream(TranscriptionStream):
+    def __init__(self, backend, sample_rate, language, max_bytes):
+        self.backend = backend
+        self.sample_rate = sample_rate
+        self.language = language
+        self.max_bytes = max_bytes
+        self.buffer = bytearray()
+
+    def accept(self, chunk):
+        if len(self.buffer) + len(chunk) > self.max_bytes:
+            raise AudioTooLong(f"answer exceeds {self.max_bytes // (2 * self.sample_rate)} seconds of audio")
+        self.buffer.extend(chunk)
+        return ""
+
+    def finish(self):
+        return self.backend.transcribe(bytes(self.buffer), self.sample_rate, self.language)
+
+
+class WhisperBackend(TranscriptionBackend):
+    """
+    Offline ASR via faster-whisper. Whisper is not incremental, so audio is buffered
+    and decoded once the utterance ends. WHISPER_MODEL selects the model size (default "base.en");
+    WHISPER_MAX_SECONDS caps how much audio one answer may buffer (default 300).
+    """
+    name = 'whisper'
+
+    def __init__(self):
+        self._model = None
+        self._failed = False
+        self._lock = threading.Lock()
+        self.max_bytes = int(os.getenv("WHISPER_MAX_SECONDS", "300")) * 16000 * 2
+        try:
+            from faster_whisper import WhisperModel
+            self._model_cls = WhisperModel
+        except ImportError:
+            print("[TranscriptionService] faster-whisper is not installed; voice answers cannot be transcribed.")
+            self._model_cls = None
+
+    def enabled(self, language=None):
+        return self._model_cls is not None and not self._failed
+
+    def supports_sample_rate(self, sample_rate):
+        # faster-whisper takes a bare float array and assumes 16 kHz
+        return sample_rate == 16000
+
+    def create_stream(self, sample_rate, language):
+        if not self.enabled():
+            return None
+        # Load the model when the answer starts so a bad WHISPER_MODEL fails before any audio is buffered
+        try:
+            self._load()
+        except Exception as e:
+            print(f"[TranscriptionService] Failed to load Whisper model {os.getenv('WHISPER_MODEL', 'base.en')}: {e}")
+            self._failed = True
+            return None
+        return _BufferedStream(self, sample_rate, language, self.max_bytes)
+
+    def _load(self):
+        with self._lock:
+            if self._model is None:
+                self._model = self._model_cls(os.getenv("WHISPER_MODEL", "base.en"), device="cpu", compute_type="int8")
+            return self._model
+
+    def transcribe(self, pcm, sample_rate, language):
+        import numpy as np
+        if not pcm:
+            return ""
+        audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self._load().transcribe(audio, language=language.split('-')[0], beam_size=1)
+        return " ".join(s.text.strip() for s in segments).strip()
+
+
+BACKENDS = {
+    'vosk': VoskBackend,
+    'whisper': WhisperBackend,
+}
+
+
+class TranscriptionService:
+    """
+    Keeps one TranscriptionStream per answer so audio can arrive over several requests.
+    ASR_BACKEND selects the backend ("vosk" or "whisper"; default "vosk").
+    """
+    SESSION_TTL_SECONDS = 600
+
+    def __init__(self, backend: Optional[TranscriptionBackend] = None):
+        if backend is None:
+            backend_cls = BACKENDS.get(os.getenv("ASR_BACKEND", "vosk").lower(), TranscriptionBackend)
+            backend = backend_cls()
+        self.backend = backend
+        self._sessions: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _language(accent):
+        return ACCENT_LANGUAGES.get((accent or '').lower(), 'en-us')
+
+    def enabled(self, accent=None):
+        return self.backend.enabled(self._language(accent) if accent else None)
+
+    def supports_sample_rate(self, sample_rate):
+        return self.backend.supports_sample_rate(sample_rate)
+
+    def _evict_stale(self, now):
+        stale = [k for k, s in self._sessions.items() if now - s['touched'] > self.SESSION_TTL_SECONDS]
+        for key in stale:
+            self._sessions.pop(key, None)
+
+    def _session(self, key, sample_rate, accent):
+        now = time.time()
+        with self._lock:
+            self._evict_stale(now)
+            session = self._sessions.get(key)
+        if session is None:
+            # Creating a stream may load a model; keep that out of the lock other sessions need
+            stream = self.backend.create_stream(sample_rate, self._language(accent))
+            if stream is None:
+                return None
+            with self._lock:
+                session = self._sessions.setdefault(key, {'stream': stream, 'lock': threading.Lock(), 'text': "",
+                                                          'sample_rate': sample_rate, 'pending': b""})
+        with self._lock:
+            if session['sample_rate'] != sample_rate:
+                raise ValueError(f"sample_rate {sample_rate} does not match this answer's {session['sample_rate']} Hz; "
+                                 f"restart the answer with start=true")
+            session['touched'] = now
+            return session
+
+    def accept(self, key, chunk, sample_rate=16000, accent=None):
+        """
+        Feed a chunk of PCM audio; returns the transcript so far (None if ASR is unavailable).
+        Raises ValueError if sample_rate differs from the rate the answer started with.
+        """
+        session = self._session(key, sample_rate, accent)
+        if session is None:
+            return None
+        with session['lock']:
+            data = session['pending'] + chunk
+            # Hold back an odd trailing byte so samples are never split across chunks
+            cut = len(data) - len(data) % 2
+            session['pending'] = data[cut:]
+            if cut:
+                session['text'] = session['stream'].accept(data[:cut])
+            return session['text']
+
+    def finish(self, key):
+        """Close the utterance and return its final transcript (None if no audio was received)."""
+        with self._lock:
+            session = self._sessions.pop(key, None)
+        if session is None:
+            return None
+        with session['lock']:
+            return session['stream'].finish()
+
+    def discard(self, key):
+        with self._lock:
+            self._sessions.pop(key, None)